@@ -22,6 +22,14 @@ nt = 100          # Number of exposure time values to explore
 SXlim = 1.21e-16  # Confusion flux limit (cgs)
 outfile = 'outfile.txt' # Filename with the output exposure time and flux limits
 pngfile = 'pngfile.png' # Filename with a plot with the above values
+Lzmode = False    # Compute limiting luminosity vs redshift
+zmin = 0.1        # Minimum value of the redshift grid
+zmax = 6.0        # Maximum value of the redshift grid
+nz = 60           # Number of redshift values to explore
+Lztexps = [1.e4,1.e5,1.e6] # Exposure times (s) for the limiting luminosities
+Lbands = [[2.0,10.0]]      # Rest frame energy band(s) for the luminosities (keV)
+Lzoutfile = 'Lzoutfile.txt' # Filename with the output redshift, exposure time and luminosity limits
+Lzpngfile = 'Lzpngfile.png' # Filename with a plot with the above values
 
 
 dict_params = dict(
@@ -43,7 +51,15 @@ dict_params = dict(
     nt=nt,
     SXlim=SXlim,
     outfile=outfile,
-    pngfile=pngfile
+    pngfile=pngfile,
+    Lzmode=Lzmode,
+    zmin=zmin,
+    zmax=zmax,
+    nz=nz,
+    Lztexps=Lztexps,
+    Lbands=Lbands,
+    Lzoutfile=Lzoutfile,
+    Lzpngfile=Lzpngfile
 )
 
 print("Running jupyter-notebook")
@@ -60,8 +60,40 @@ if __name__ == "__main__":
     )
     parser.add_argument("--pngfile",type=str, required=False,default='pngfile.png',
                         help='Filename with a plot with the above values (default pngfile.png)')
+    parser.add_argument("--Lzmode",action='store_true',
+                        help="Also compute the limiting luminosity as a function of redshift"
+    )
+    parser.add_argument("--zmin",type=float, required=False,default=0.1,
+                        help="Minimum value of the redshift grid (default 0.1)"
+    )
+    parser.add_argument("--zmax",type=float, required=False,default=6.0,
+                        help="Maximum value of the redshift grid (default 6.0)"
+    )
+    parser.add_argument("--nz",type=int, required=False,default=60,
+                        help="Number of redshift values to explore (default 60)"
+    )
+    parser.add_argument("--Lztexps",type=float, nargs='+', required=False,default=[1e4,1e5,1e6],
+                        help="Exposure times (s) for the limiting luminosities (default 1e4 1e5 1e6)"
+    )
+    parser.add_argument("--Lbands",type=float, nargs='+', required=False,default=[2.0,10.0],
+                        help="Rest frame energy band(s) for the luminosities, as pairs Emin Emax (keV, default 2.0 10.0)"
+    )
+    parser.add_argument("--Lzoutfile",type=str, required=False,default='Lzoutfile.txt',
+                        help='Filename with the output redshift, exposure time and luminosity limits (default: Lzoutfile.txt)'
+    )
+    parser.add_argument("--Lzpngfile",type=str, required=False,default='Lzpngfile.png',
+                        help='Filename with a plot with the above values (default Lzpngfile.png)')
 
     inargs=parser.parse_args()
+    if len(inargs.Lbands)%2 != 0:
+        parser.error("--Lbands requires pairs of values: Emin Emax")
+    if inargs.zmin <= 0:
+        parser.error("--zmin must be > 0")
+    if inargs.zmax < inargs.zmin:
+        parser.error("--zmax must be >= --zmin")
+    if inargs.nz < 1:
+        parser.error("--nz must be >= 1")
+    Lbands=[inargs.Lbands[i:i+2] for i in range(0,len(inargs.Lbands),2)]
 
     dict_params = dict(
         rmffile=inargs.rmffile,
@@ -82,7 +114,15 @@ if __name__ == "__main__":
         nt=inargs.nt,
         SXlim=inargs.SXlim,
         outfile=inargs.outfile,
-        pngfile=inargs.pngfile
+        pngfile=inargs.pngfile,
+        Lzmode=inargs.Lzmode,
+        zmin=inargs.zmin,
+        zmax=inargs.zmax,
+        nz=inargs.nz,
+        Lztexps=inargs.Lztexps,
+        Lbands=Lbands,
+        Lzoutfile=inargs.Lzoutfile,
+        Lzpngfile=inargs.Lzpngfile
     )
     print("Running jupyter-notebook")
     pm.execute_notebook(
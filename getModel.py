@@ -23,7 +23,32 @@ For a copy of the GNU General Public License see
 <http://www.gnu.org/licenses/>.
 """
 
-from xspec import Model, FakeitSettings
+import numpy as np
+from xspec import Model, FakeitSettings, Xset
+
+# Results of the redshift grid functions, keyed on their inputs and on the
+# relevant XSPEC settings, so that re-executing cells in the same session
+# does not recompute them. Each new (e.g. papermill) kernel starts empty
+_gridCache={}
+
+def clearGridCache():
+    """
+    Empty the cache of the redshift grid functions
+    """
+    _gridCache.clear()
+
+def _gridKey(*args):
+    """
+    Hashable cache key built from lists/lists of lists/scalars
+    """
+    key=[]
+    for arg in args:
+        if isinstance(arg,(list,tuple,np.ndarray)):
+            key.append(tuple(tuple(a) if isinstance(a,(list,tuple,np.ndarray))
+                             else a for a in arg))
+        else:
+            key.append(arg)
+    return tuple(key)
 
 def getModelCR(AllModels,AllData,smodel,pars,rmffile,arffile,intervals,
                sname='mod1234',Texp=1e9):
@@ -182,3 +207,193 @@ def getModelFlux(AllModels,smodel,pars,intervals,sname='mod1234'):
     AllModels-=sname
 
     return fluxes
+
+def getModelCRGrid(AllModels,AllData,smodel,pars,rmffile,arffile,intervals,
+                   zs,zpars,sname='mod1234',Texp=1e9):
+    """
+    Count rates for the given spectral model in the given energy interval(s)
+    over a grid of redshifts. The response is loaded (fakeit) only once and
+    the redshift parameters are changed in place for each z
+
+    Parameters
+    ----------
+    AllModels : pyXspec container
+        PyXspec automatically creates a single object of xspec.ModelManager, 
+        named AllModels
+    AllData : pyXspec parameter
+        Spectral data container. PyXspec automatically creates a single 
+        object of class xspec.DataManager, named AllData
+    smodel : pyXspec container
+        The model expression string, using full component names
+    pars : LIST
+        Parameters of the given spectral model
+    rmffile : STRING
+        Filename with full path of the response file for the source spectrum
+    arffile : STRING
+        Filename with full path of the auxiliary response file for 
+        the source spectrum
+    intervals : LIST of lists
+        Energy interval as: [Emin, Emax] (keV)
+        e.g., [[0.5,2.0],[2.0,10.0]] for 0.5-2 keV and 2-10 keV
+    zs : LIST
+        Redshift values
+    zpars : LIST
+        Indices (starting at 1) of the model parameters set to each redshift
+        e.g., [3,5] for the redshifts of zpha and zpow in 'pha*zpha*zpow'
+    sname : STRING, optional
+        Name of the spectral model. The default is 'mod1234'
+    Texp : FLOAT, optional
+        Exposure time in s. The default is 1e9
+
+    Returns
+    -------
+    countrates : numpy ARRAY
+        Count rates with shape (len(zs),len(intervals)) in counts per second
+
+    """
+
+    key=_gridKey('CR',smodel,pars,rmffile,arffile,intervals,zs,zpars,Texp,
+                 str(Xset.abund),str(Xset.xsect))
+    if key in _gridCache:
+        return _gridCache[key].copy()
+
+    mymodel=Model(smodel,sname)
+    AllModels.setPars(mymodel,pars)
+
+    if (len(arffile)==0):
+
+        rspfile=rmffile
+        fs1=FakeitSettings(rspfile,exposure=Texp)
+    else:
+        fs1=FakeitSettings(rmffile, arffile, exposure=Texp)
+
+    AllData.fakeit(1,fs1,applyStats=False,noWrite=True)
+
+    spec=AllData(1)
+    countrates=np.zeros((len(zs),len(intervals)))
+    for i, interval in enumerate(intervals):
+        spec.notice("all")
+        srange="0.0-{} {}-**".format(interval[0],interval[1])
+        spec.ignore(srange)
+        for j, z in enumerate(zs):
+            AllModels.setPars(mymodel,{ipar:z for ipar in zpars})
+            countrates[j,i]=spec.rate[3]
+
+    AllModels-=sname
+    del fs1
+    AllData -= spec
+    del spec
+
+    _gridCache[key]=countrates
+    return countrates.copy()
+
+def getModelFluxGrid(AllModels,smodel,pars,intervals,zs,zpars,
+                     sname='mod1234'):
+    """
+    Flux for the given model in the required band(s) in cgs units
+    (erg cm-2 s-1) over a grid of redshifts. The model and the energy array
+    are set up only once
+
+    Parameters
+    ----------
+    AllModels : pyXspec container
+        PyXspec automatically creates a single object of xspec.ModelManager, 
+        named AllModels
+    smodel : pyXspec container
+        The model expression string, using full component names
+    pars : LIST
+        Parameters of the given spectral model
+    intervals :LIST of lists
+        Observed frame energy interval as: [Emin, Emax] (keV)
+        e.g., [[0.5,2.0],[2.0,10.0]] for 0.5-2 keV and 2-10 keV
+    zs : LIST
+        Redshift values
+    zpars : LIST
+        Indices (starting at 1) of the model parameters set to each redshift
+        e.g., [3,5] for the redshifts of zpha and zpow in 'pha*zpha*zpow'
+    sname : STRING, optional
+        Name of the spectral model. The default is 'mod1234'
+
+    Returns
+    -------
+    fluxes : numpy ARRAY
+       Fluxes with shape (len(zs),len(intervals)) in erg cm-2 s-1
+
+    """
+
+    key=_gridKey('Flux',smodel,pars,intervals,zs,zpars,str(Xset.abund),
+                 str(Xset.xsect))
+    if key in _gridCache:
+        return _gridCache[key].copy()
+
+    mymodel=Model(smodel,sname)
+    AllModels.setPars(mymodel,pars)
+    AllModels.setEnergies("0.01 100 10000")
+
+    fluxes=np.zeros((len(zs),len(intervals)))
+    for i, interval in enumerate(intervals):
+        for j, z in enumerate(zs):
+            AllModels.setPars(mymodel,{ipar:z for ipar in zpars})
+            AllModels.calcFlux('{0:f} {1:f}'.format(interval[0],interval[1]))
+            fluxes[j,i]=AllModels(1,sname).flux[0]
+
+    AllModels.setEnergies("reset")
+    AllModels-=sname
+
+    _gridCache[key]=fluxes
+    return fluxes.copy()
+
+def getModelLumGrid(AllModels,smodel,pars,intervals,zs,zpars,
+                    sname='mod1234'):
+    """
+    Luminosity in the required rest frame energy interval(s) over a grid of
+    redshifts, as getModelLum but with the model and the energy array set up
+    only once for all redshifts and intervals
+
+    Parameters
+    ----------
+    AllModels : pyXspec container
+        PyXspec automatically creates a single object of 
+        xspec.ModelManager, named AllModels
+    smodel : pyXspec container
+        The model expression string, using full component names
+    pars : LIST
+        Parameters of the given spectral model
+    intervals :LIST of lists
+        Rest frame energy interval as: [Emin, Emax] (keV)
+        e.g., [[0.5,2.0],[2.0,10.0]] for 0.5-2 keV and 2-10 keV
+    zs : LIST
+        Redshift values
+    zpars : LIST
+        Indices (starting at 1) of the model parameters set to each redshift
+        e.g., [3,5] for the redshifts of zpha and zpow in 'pha*zpha*zpow'
+    sname : STRING, optional
+        Name of the spectral model. The default is 'mod1234'.
+
+    Returns
+    -------
+    luminosities : numpy ARRAY
+        Luminosities with shape (len(zs),len(intervals)) in erg s-1 units
+
+    """
+
+    key=_gridKey('Lum',smodel,pars,intervals,zs,zpars,str(Xset.cosmo))
+    if key in _gridCache:
+        return _gridCache[key].copy()
+
+    mymodel=Model(smodel,sname)
+    AllModels.setPars(mymodel,pars)
+    AllModels.setEnergies("0.01 100 10000")
+
+    luminosities=np.zeros((len(zs),len(intervals)))
+    for i, interval in enumerate(intervals):
+        for j, z in enumerate(zs):
+            AllModels.setPars(mymodel,{ipar:z for ipar in zpars})
+            AllModels.calcLumin('{0:f} {1:f} {2:f}'.format(interval[0],interval[1],z))
+            luminosities[j,i]=AllModels(1,sname).lumin[0]*1e44
+
+    AllModels.setEnergies("reset")
+    AllModels-=sname
+
+    _gridCache[key]=luminosities
+    return luminosities.copy()